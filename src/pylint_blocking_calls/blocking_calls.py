@@ -1,6 +1,7 @@
 import os
 from collections import defaultdict
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
 
 from astroid import nodes
 from pylint.checkers import BaseChecker
@@ -64,107 +65,175 @@ class BlockingCallsChecker(BaseChecker):
 
         # caches for inner purpose
         self._all_visited_calls: Dict[str, List[nodes.Call]] = defaultdict(list)
-        self._calls_of_blocking_functions: List[nodes.Call] = []
-        self._blocking_calls_hashes: Set[str] = set()
+        # keyed by the call node hash to collect each call once, in the visiting order,
+        # along with the call name
+        self._calls_of_blocking_functions: Dict[int, Tuple[nodes.Call, str]] = {}
+        self._blocking_calls_hashes: Set[int] = set()
+        # index of the found calls by the function being called, filled in `close()`
+        self._calls_by_function: Dict[helpers.FunctionDef, List[nodes.Call]] = {}
+
+        # option regexps merged into as few alternations as possible in `open()`
+        self._blocking_regexps: List[Pattern[str]] = []
+        self._skip_functions_regexps: List[Pattern[str]] = []
+        self._skip_modules_regexps: List[Pattern[str]] = []
+        self._skip_decorated_regexps: List[Pattern[str]] = []
+
+        # whether the module being checked is skipped, computed once per module
+        self._current_module_name: Optional[str] = None
+        self._current_module_skipped = False
+
+    def open(self) -> None:
+        """This method is called once before checking any .py files."""
+        self._compile_options()
+
+    def _compile_options(self) -> None:
+        """Merge the option regexps, so each name is matched against fewer regexps."""
+        self._blocking_regexps = helpers.merge_regexps(
+            self.config.blocking_function_names
+        )
+        self._skip_functions_regexps = helpers.merge_regexps(self.config.skip_functions)
+        self._skip_modules_regexps = helpers.merge_regexps(self.config.skip_modules)
+        self._skip_decorated_regexps = helpers.merge_regexps(self.config.skip_decorated)
+        self._current_module_name = None
 
     def visit_call(self, call: nodes.Call) -> None:
         """Called each time when a `nodes.Call` node is visited"""
-        if self._should_call_be_checked(call):
-            call_name = helpers.get_call_name(call)
+        if not self._blocking_regexps:
+            # nothing can be blocking when no blocking function names are configured
+            return
+        frame = self._get_frame_to_check(call)
+        if frame is not None:
+            call_name = helpers.get_call_name(call, frame)
             if call_name is not None:
                 # cache each visited call by the call name
                 self._all_visited_calls[call_name].append(call)
                 if self._is_blocking_function_call(call_name):
                     # collect calls of the blocking functions
-                    self._calls_of_blocking_functions.append(call)
+                    self._calls_of_blocking_functions.setdefault(
+                        helpers.get_call_node_hash(call), (call, call_name)
+                    )
+
+    def _get_frame_to_check(self, call: nodes.Call) -> Optional[helpers.FunctionDef]:
+        """Get the function in which the call happens.
 
-    def _should_call_be_checked(self, call: nodes.Call) -> bool:
-        """Whether the call should be checked or not."""
+        Return None if the call shouldn't be checked.
+        """
+        if self._is_current_module_skipped():
+            # skip calls that happen inside a module that should be skipped
+            return None
         frame = call.frame()
         if not isinstance(frame, (nodes.FunctionDef, nodes.AsyncFunctionDef)):
             # skip calls that happens outside a function (they can't be blocking)
-            return False
-        for regexp in self.config.skip_modules:
-            if regexp.match(self.linter.current_name):
-                # skip calls that happen inside a module that should be skipped
-                return False
-        for regexp in self.config.skip_functions:
-            if regexp.match(frame.name):
-                # skip calls that happen inside a function that should be skipped
-                return False
-        return True
+            return None
+        if helpers.match_any(self._skip_functions_regexps, frame.name):
+            # skip calls that happen inside a function that should be skipped
+            return None
+        return frame
+
+    def _is_current_module_skipped(self) -> bool:
+        """Check if the module being checked should be skipped.
+
+        The result is computed once per module, not for each visited call.
+        """
+        if self.linter.current_name != self._current_module_name:
+            self._current_module_name = self.linter.current_name
+            self._current_module_skipped = helpers.match_any(
+                self._skip_modules_regexps, self._current_module_name
+            )
+        return self._current_module_skipped
 
     def _is_blocking_function_call(self, call_name: str) -> bool:
         """Check if it is the call of a blocking function."""
-        for regexp in self.config.blocking_function_names:
-            if regexp.match(call_name):
-                return True
-        return False
+        return helpers.match_any(self._blocking_regexps, call_name)
 
     def close(self):
         """This method is called once after checking all .py files."""
-        self._traverse_blocking_function_calls(self._calls_of_blocking_functions)
+        if not self._calls_of_blocking_functions:
+            return
+        self._calls_by_function = {}
+        self._traverse_blocking_function_calls(
+            self._calls_of_blocking_functions.values()
+        )
 
     def _traverse_blocking_function_calls(
-        self,
-        calls_to_traverse: List[nodes.Call],
-        traversed_sequence: Tuple[nodes.Call, ...] = (),
+        self, calls_to_traverse: Iterable[Tuple[nodes.Call, str]]
     ) -> None:
-        """Traverse the blocking functions calls with the recursive DFS.
+        """Traverse the blocking functions calls with the iterative DFS.
 
         Find all the blocking calls, and add messages for them.
         """
-        for call in calls_to_traverse:
-            if self._should_stop_traversal(call, traversed_sequence):
+        # calls are traversed only once: reaching a call again (e.g. through a loop
+        # or another path of the shared callers) can't find any new blocking calls
+        traversed: Set[int] = set()
+        # names of the calls from the blocking function call to the one being traversed
+        path_names: List[str] = []
+        # the calls left to traverse for each call of the path (and for the path start),
+        # along with their names
+        stack: List[Iterator[Tuple[nodes.Call, str]]] = [iter(calls_to_traverse)]
+        while stack:
+            next_call = next(stack[-1], None)
+            if next_call is None:
+                # all the calls of the last path call are traversed, step back
+                stack.pop()
+                if path_names:
+                    path_names.pop()
+                continue
+            call, call_name = next_call
+            call_hash = helpers.get_call_node_hash(call)
+            if call_hash in traversed:
                 continue
+            traversed.add(call_hash)
             function_def: helpers.FunctionDef = call.frame()
+            if self._should_stop_traversal(function_def):
+                continue
             # if the call happens inside an async function, it's a blocking call
             if isinstance(function_def, nodes.AsyncFunctionDef):
-                if helpers.get_call_node_hash(call) not in self._blocking_calls_hashes:
+                if call_hash not in self._blocking_calls_hashes:
                     # hash the call node to avoid messages duplicates
-                    self._add_blocking_call_message(call, reversed(traversed_sequence))
-                    self._blocking_calls_hashes.add(helpers.get_call_node_hash(call))
+                    self._add_blocking_call_message(
+                        call, [call_name] + path_names[::-1]
+                    )
+                    self._blocking_calls_hashes.add(call_hash)
                 # stop traversal for this path when found a blocking call
                 continue
-            self._traverse_blocking_function_calls(
-                self._get_calls_of_function(function_def), traversed_sequence + (call,)
+            path_names.append(call_name)
+            # the calls of a function are all found by the function name
+            stack.append(
+                zip(
+                    self._get_calls_of_function(function_def),
+                    repeat(helpers.get_function_name(function_def)),
+                )
             )
 
-    def _should_stop_traversal(
-        self, call: nodes.Call, traversed_sequence: Tuple[nodes.Call, ...]
-    ) -> bool:
-        if call in traversed_sequence:
-            # stop traversal if we found a loop
-            return True
-        function_def: helpers.FunctionDef = call.frame()
-        for regexp in self.config.skip_decorated:
-            for name in helpers.get_function_decorator_names(function_def):
-                if regexp.match(name):
-                    # skip when reached a function decorated with a decorator that should be skipped
-                    return True
+    def _should_stop_traversal(self, function_def: helpers.FunctionDef) -> bool:
+        """Check if the traversal should stop at a call made in the given function."""
+        if not self._skip_decorated_regexps:
+            return False
+        for name in helpers.get_function_decorator_names(function_def):
+            if helpers.match_any(self._skip_decorated_regexps, name):
+                # skip when reached a function decorated with a decorator that should be skipped
+                return True
         return False
 
     def _add_blocking_call_message(
-        self, blocking_call: nodes.Call, calls_sequence: Iterable[nodes.Call]
+        self, blocking_call: nodes.Call, call_names: List[str]
     ) -> None:
         self.add_message(
             "blocking-call",
             node=blocking_call,
-            args=(
-                self._call_sequence_to_str((blocking_call,) + tuple(calls_sequence)),
-            ),
+            args=(" -> ".join(call_names),),
         )
 
-    @staticmethod
-    def _call_sequence_to_str(calls_sequence: Tuple[nodes.Call, ...]) -> str:
-        return " -> ".join(helpers.get_call_name(call) for call in calls_sequence)
-
     def _get_calls_of_function(
         self, function_def: helpers.FunctionDef
     ) -> List[nodes.Call]:
         """Get all the found calls of the given function."""
-        possible_call_name = helpers.get_function_name(function_def)
-        return self._all_visited_calls.get(possible_call_name) or []
+        calls = self._calls_by_function.get(function_def)
+        if calls is None:
+            possible_call_name = helpers.get_function_name(function_def)
+            calls = self._all_visited_calls.get(possible_call_name) or []
+            self._calls_by_function[function_def] = calls
+        return calls
 
 
 def register(linter: PyLinter) -> None:
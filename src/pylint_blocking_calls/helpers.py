@@ -1,37 +1,90 @@
-from typing import List, Optional, Union
+import re
+import sys
+from typing import List, Optional, Pattern, Sequence, Union
+from weakref import WeakKeyDictionary
 
 from astroid import nodes
 
 FunctionDef = Union[nodes.FunctionDef, nodes.AsyncFunctionDef]
 
+# names are cached for the lifetime of the AST nodes
+_FUNCTION_NAME_CACHE: "WeakKeyDictionary[FunctionDef, str]" = WeakKeyDictionary()
+_DECORATOR_NAMES_CACHE: "WeakKeyDictionary[FunctionDef, List[str]]" = (
+    WeakKeyDictionary()
+)
+
+# flags of a regexp compiled without any flags
+_DEFAULT_REGEXP_FLAGS = re.compile("").flags
+
 
 def has_decorator(function_def: FunctionDef, *, decorator_name: str) -> bool:
     """Check if the function has a decorator with the given name."""
+    decorators = function_def.decorators
+    if decorators is None:
+        return False
     return any(
-        True
-        for node in getattr(function_def.decorators, "nodes", [])
-        if isinstance(node, nodes.Name) and node.as_string() == decorator_name
+        isinstance(node, nodes.Name) and node.name == decorator_name
+        for node in decorators.nodes
     )
 
 
 def get_function_decorator_names(function_def: FunctionDef) -> List[str]:
     """Get list of decorators which should be ignored"""
-    return [
-        node.as_string()
-        for node in getattr(function_def.decorators, "nodes", [])
-        if isinstance(node, nodes.Name)
-    ]
+    decorator_names = _DECORATOR_NAMES_CACHE.get(function_def)
+    if decorator_names is None:
+        decorators = function_def.decorators
+        decorator_names = _DECORATOR_NAMES_CACHE[function_def] = (
+            [node.name for node in decorators.nodes if isinstance(node, nodes.Name)]
+            if decorators is not None
+            else []
+        )
+    return decorator_names
+
+
+def merge_regexps(regexps: Sequence[Pattern[str]]) -> List[Pattern[str]]:
+    """Merge the regexps into a single alternation to match them all at once.
+
+    The regexps with groups or global inline flags like "(?i)" are kept as they are:
+    merging would renumber their groups (or repeat the group names), and the global
+    flags must stay at the start of the expression.
+    """
+    mergeable: List[Pattern[str]] = []
+    separate: List[Pattern[str]] = []
+    for regexp in regexps:
+        if regexp.groups or regexp.flags != _DEFAULT_REGEXP_FLAGS:
+            separate.append(regexp)
+        else:
+            mergeable.append(regexp)
+    if len(mergeable) < 2:
+        return list(regexps)
+    try:
+        merged = re.compile("|".join(f"(?:{regexp.pattern})" for regexp in mergeable))
+    except re.error:
+        return list(regexps)
+    return [merged] + separate
 
 
-def get_call_node_hash(call: nodes.Call) -> str:
-    """Get a unique representation of the call node"""
-    return repr(call)
+def match_any(regexps: Sequence[Pattern[str]], string: str) -> bool:
+    """Check if any of the regexps matches the string."""
+    return any(regexp.match(string) for regexp in regexps)
+
+
+def get_call_node_hash(call: nodes.Call) -> int:
+    """Get a unique representation of the call node.
+
+    The node identity is enough: the checker keeps references to the visited calls,
+    so their ids can't be reused during a lint run.
+    """
+    return id(call)
 
 
-def get_call_name(call: nodes.Call) -> Optional[str]:
+def get_call_name(
+    call: nodes.Call, frame: Optional[FunctionDef] = None
+) -> Optional[str]:
     """Get the full dotted name of the function being called.
 
     Replace the `self` and `cls` prefixes with full names of the classes.
+    Pass the `frame` of the call if it's already known to avoid looking it up again.
 
     Return None if we can't determine the function name:
         "callable[0]()"
@@ -43,47 +96,66 @@ def get_call_name(call: nodes.Call) -> Optional[str]:
         "get_session_managed"
         "cls.check_limits" -> "ClientQuotasReservation.check_limits"
     """
-    # simple case: a function is called directly
-    if isinstance(call.func, nodes.Name):
-        return call.func.name
-
-    # determine the dotted name of the function like "a.b.c.d"
-    call_name_parts = []
+    # the node types are compared by identity: it's cheaper than `isinstance`
+    # and these node classes have no subclasses
     call_func = call.func
-    while True:
-        if isinstance(call_func, nodes.Attribute):
-            call_name_parts.append(call_func.attrname)
-            call_func = call_func.expr
-        elif isinstance(call_func, nodes.Call):
-            call_func = call_func.func
-        elif isinstance(call_func, nodes.Name):
-            call_name_parts.append(call_func.name)
-            break
-        else:
-            return None
-    call_name_parts = list(reversed(call_name_parts))
+    # simple case: a function is called directly
+    if type(call_func) is nodes.Name:
+        return call_func.name
+
+    if type(call_func) is nodes.Attribute and type(call_func.expr) is nodes.Name:
+        # common case: an attribute of a name is called like "a.b"
+        call_name_parts = [call_func.expr.name, call_func.attrname]
+    else:
+        # determine the dotted name of the function like "a.b.c.d"
+        call_name_parts = []
+        while True:
+            call_func_type = type(call_func)
+            if call_func_type is nodes.Attribute:
+                call_name_parts.append(call_func.attrname)
+                call_func = call_func.expr
+            elif call_func_type is nodes.Call:
+                call_func = call_func.func
+            elif call_func_type is nodes.Name:
+                call_name_parts.append(call_func.name)
+                break
+            else:
+                return None
+        call_name_parts.reverse()
 
     # replace "cls" and "self" with the class name
-    function_def: FunctionDef = call.frame()
-    if function_def.is_method() and call_name_parts[0] in ("self", "cls"):
-        class_name = function_def.parent.name  # type: ignore
-        call_name_parts[0] = class_name
+    if call_name_parts[0] in ("self", "cls"):
+        # look up the function only for these names: most calls don't need it
+        function_def: FunctionDef = frame if frame is not None else call.frame()
+        if function_def.is_method():
+            class_name = function_def.parent.name  # type: ignore
+            call_name_parts[0] = class_name
 
-    return ".".join(call_name_parts)
+    # the same names are repeated across the code base, so share a single string
+    # for them: this also speeds up the lookups of the calls by their names
+    return sys.intern(".".join(call_name_parts))
 
 
 def get_function_name(function_def: FunctionDef) -> str:
     """Get full dotted name of the function.
     Examples: "get_session_managed", "VolumeMetadataItemHandler.post", etc.
     """
+    function_name = _FUNCTION_NAME_CACHE.get(function_def)
+    if function_name is None:
+        function_name = _FUNCTION_NAME_CACHE[function_def] = _get_function_name(
+            function_def
+        )
+    return function_name
+
+
+def _get_function_name(function_def: FunctionDef) -> str:
     if function_def.is_method():
         class_name = function_def.parent.name  # type: ignore
-        return f"{class_name}.{function_def.name}"
+        # intern like the call names, they are looked up in the same dict
+        return sys.intern(f"{class_name}.{function_def.name}")
     return function_def.name
 
 
 def find_module_name(node):
     """Trying to find 'nodes.Module' from given node. Then get name of this module"""
-    while not isinstance(node, nodes.Module):
-        node = node.parent
-    return node.name
+    return node.root().name
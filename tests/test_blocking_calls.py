@@ -1,25 +1,38 @@
+import re
+import sys
+
 import astroid
 import pylint.testutils
 
 from src.pylint_blocking_calls import helpers
 from src.pylint_blocking_calls.blocking_calls import BlockingCallsChecker
 
+# the option values as they are set in the environment variables
+BLOCKING_FUNCTION_NAMES = r"^.*auth\.get_auth_ref$,^.*barbican.*\..+$,^.*cinder.*\..+$,^.*glance.*\..+$,^.*heat.*\..+$,^.*ironic.*\..+$,^.*neutron.*\..+$,^.*nova.*\..+$,^.*octavia.*\..+$,^get_session$,^.*session.*\.(commit|delete|rollback|refresh|close)$,^.*session.*\..+\.get$,^requests\.(get|post|put|patch|delete)$,^.+\.(one|one_or_none|all|first)$,^.*keystone.*\.(?:access_rules|application_credentials|auth|credentials|ec2|endpoint_filter|endpoint_groups|endpoint_policy|endpoints|domain_configs|domains|federation|groups|limits|policies|projects|registered_limits|regions|role_assignments|roles|inference_rules|services|simple_cert|tokens|trusts|users).*$"
+SKIP_FUNCTIONS = r"^delete_.+$"
+SKIP_MODULES = (
+    r"^src\.db\.task$,^src\.db\.tasks\..+$,^src\.worker\..+$,^src\.tests\..+$"
+)
+SKIP_DECORATED = r"^thread$"
+
+
+def compile_regexp_csv(value):
+    """Compile the comma-separated regexps like pylint does for the regexp_csv options."""
+    return [re.compile(pattern) for pattern in value.split(",")]
+
 
 class TestBlockingCallsChecker(pylint.testutils.CheckerTestCase):
     CHECKER_CLASS = BlockingCallsChecker
+    # set on the linter config before the checker is opened
+    CONFIG = {
+        "blocking_function_names": compile_regexp_csv(BLOCKING_FUNCTION_NAMES),
+        "skip_functions": compile_regexp_csv(SKIP_FUNCTIONS),
+        "skip_modules": compile_regexp_csv(SKIP_MODULES),
+        "skip_decorated": compile_regexp_csv(SKIP_DECORATED),
+    }
 
     def setup_method(self):
         super().setup_method()
-        self.checker.set_option(
-            "blocking-function-names",
-            r"^.*auth\.get_auth_ref$,^.*barbican.*\..+$,^.*cinder.*\..+$,^.*glance.*\..+$,^.*heat.*\..+$,^.*ironic.*\..+$,^.*neutron.*\..+$,^.*nova.*\..+$,^.*octavia.*\..+$,^get_session$,^.*session.*\.(commit|delete|rollback|refresh|close)$,^.*session.*\..+\.get$,^requests\.(get|post|put|patch|delete)$,^.+\.(one|one_or_none|all|first)$,^.*keystone.*\.(access_rules|application_credentials|auth|credentials|ec2|endpoint_filter|endpoint_groups|endpoint_policy|endpoints|domain_configs|domains|federation|groups|limits|policies|projects|registered_limits|regions|role_assignments|roles|inference_rules|services|simple_cert|tokens|trusts|users).*$",
-        )
-        self.checker.set_option("skip-functions", r"^delete_.+$")
-        self.checker.set_option(
-            "skip-modules",
-            r"^src\.db\.task$,^src\.db\.tasks\..+$,^src\.worker\..+$,^src\.tests\..+$",
-        )
-        self.checker.set_option("skip-decorated", r"^thread$")
         self.checker.linter.current_name = "test_file.py"
 
     def test_check_unnamed_functions_ignored(self):
@@ -81,8 +94,7 @@ class TestBlockingCallsChecker(pylint.testutils.CheckerTestCase):
             ),
             ignore_position=True,
         ):
-            for call in calls:
-                self.checker.visit_call(call)
+            self.walk(calls[0].root())
             self.checker.close()
 
     def test_check_blocking_calls_in_methods(self):
@@ -168,6 +180,57 @@ class TestBlockingCallsChecker(pylint.testutils.CheckerTestCase):
                 self.checker.visit_call(call)
             self.checker.close()
 
+    def test_check_awaited_calls_blocking(self):
+        awaited_commit, awaited_wait_for, refresh = astroid.extract_node(
+            """
+            async def async_function():
+                await session.commit()  #@
+                await asyncio.wait_for(session.refresh(), 5)  #@
+                session.refresh()  #@
+        """
+        )
+        with self.assertAddsMessages(
+            # synchronous functions block before their results are awaited
+            pylint.testutils.MessageTest(
+                msg_id="blocking-call",
+                node=awaited_commit.value,
+                args=("session.commit",),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="blocking-call",
+                node=awaited_wait_for.value.args[0],
+                args=("session.refresh",),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="blocking-call", node=refresh, args=("session.refresh",)
+            ),
+            ignore_position=True,
+        ):
+            self.walk(refresh.root())
+            self.checker.close()
+
+    def test_check_awaited_sync_wrapper_blocking(self):
+        calls = astroid.extract_node(
+            """
+            def sync_wrapper(url):
+                requests.get(url)  #@
+                return asyncio.sleep(0)  #@
+
+            async def async_function():
+                await sync_wrapper("url")  #@
+        """
+        )
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="blocking-call",
+                node=calls[2].value,
+                args=("sync_wrapper -> requests.get",),
+            ),
+            ignore_position=True,
+        ):
+            self.walk(calls[0].root())
+            self.checker.close()
+
     def test_check_blocking_call_names(self):
         calls = astroid.extract_node(
             """              
@@ -233,6 +296,89 @@ class TestBlockingCallsChecker(pylint.testutils.CheckerTestCase):
                 self.checker.visit_call(call)
             self.checker.close()
 
+    def test_check_blocking_function_names_alternatives(self):
+        self.linter.config.blocking_function_names = [
+            re.compile(r"^first$|^second$"),
+            re.compile(r"^third\..+$"),
+            re.compile(r"^(get|post)_data$"),
+            # the backreference would point to the group of the previous pattern
+            # if the patterns were naively merged into a single alternation
+            re.compile(r"^(\w+)\.\1$"),
+        ]
+        self.checker.open()
+        calls = astroid.extract_node(
+            """
+            async def async_function():
+                first()  #@
+                second()  #@
+                third.call()  #@
+                get_data()  #@
+                session.session()  #@
+                not_first()  #@
+                third()  #@
+                session.other()  #@
+        """
+        )
+        with self.assertAddsMessages(
+            *(
+                pylint.testutils.MessageTest(
+                    msg_id="blocking-call",
+                    node=call,
+                    args=(helpers.get_call_name(call),),
+                )
+                for call in calls[:5]
+            ),
+            ignore_position=True,
+        ):
+            self.walk(calls[0].root())
+            self.checker.close()
+
+    def test_check_blocking_function_names_with_inline_flags(self):
+        self.linter.config.blocking_function_names = [
+            re.compile(r"(?i)^requests\.get$"),
+            re.compile(r"^get_session$"),
+            re.compile(r"^.*session.*\.commit$"),
+        ]
+        self.checker.open()
+        calls = astroid.extract_node(
+            """
+            async def async_function():
+                Requests.GET()  #@
+                get_session()  #@
+                session.commit()  #@
+                requests.post()  #@
+        """
+        )
+        with self.assertAddsMessages(
+            *(
+                pylint.testutils.MessageTest(
+                    msg_id="blocking-call",
+                    node=call,
+                    args=(helpers.get_call_name(call),),
+                )
+                for call in calls[:3]
+            ),
+            ignore_position=True,
+        ):
+            self.walk(calls[0].root())
+            self.checker.close()
+
+    def test_check_no_blocking_function_names(self):
+        self.linter.config.blocking_function_names = []
+        self.checker.open()
+        calls = astroid.extract_node(
+            """
+            async def async_function():
+                get_session()  #@
+                session.commit()  #@
+        """
+        )
+        with self.assertNoMessages():
+            self.walk(calls[0].root())
+            self.checker.close()
+
+        assert not self.checker._all_visited_calls
+
     def test_skip_function_names(self):
         calls = astroid.extract_node(
             """
@@ -256,6 +402,12 @@ class TestBlockingCallsChecker(pylint.testutils.CheckerTestCase):
             self.checker.close()
 
     def test_skip_module_names(self):
+        call = astroid.extract_node(
+            """
+            async def async_blocking_function(self):
+                self.barbican().secrets.get()           #@
+        """
+        )
         for module_name in (
             "src.db.task",
             "src.db.tasks.ai",
@@ -265,12 +417,76 @@ class TestBlockingCallsChecker(pylint.testutils.CheckerTestCase):
             "src.tests.common.common",
         ):
             self.checker.linter.current_name = module_name
-            call = astroid.extract_node(
-                """                        
-                async def async_blocking_function(self):
-                    self.barbican().secrets.get()           #@
-            """
-            )
             with self.assertNoMessages():
                 self.checker.visit_call(call)
                 self.checker.close()
+
+        # calls in the skipped modules are dropped before their names are resolved
+        assert not self.checker._all_visited_calls
+
+    def test_check_deep_call_chain(self):
+        depth = sys.getrecursionlimit() + 100
+        functions = "".join(
+            f"""
+            def function_{i}():
+                function_{i + 1}()  #@
+            """
+            for i in range(depth)
+        )
+        calls = astroid.extract_node(
+            f"""
+            def function_{depth}():
+                get_session()  #@
+            {functions}
+            async def async_function():
+                function_0()  #@
+        """
+        )
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="blocking-call",
+                node=calls[-1],
+                args=(
+                    " -> ".join(
+                        [f"function_{i}" for i in range(depth + 1)] + ["get_session"]
+                    ),
+                ),
+            ),
+            ignore_position=True,
+        ):
+            self.walk(calls[0].root())
+            self.checker.close()
+
+    def test_check_recursive_calls(self):
+        calls = astroid.extract_node(
+            """
+            def sync_blocking_function(retry):
+                get_session()  #@
+                if retry:
+                    recursive_function(retry - 1)  #@
+
+            def recursive_function(retry):
+                sync_blocking_function(retry)  #@
+
+            async def async_function():
+                recursive_function(3)  #@
+                sync_blocking_function(3)  #@
+        """
+        )
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(
+                msg_id="blocking-call",
+                node=calls[4],
+                args=(
+                    "sync_blocking_function -> recursive_function -> sync_blocking_function -> get_session",
+                ),
+            ),
+            pylint.testutils.MessageTest(
+                msg_id="blocking-call",
+                node=calls[3],
+                args=("recursive_function -> sync_blocking_function -> get_session",),
+            ),
+            ignore_position=True,
+        ):
+            self.walk(calls[0].root())
+            self.checker.close()